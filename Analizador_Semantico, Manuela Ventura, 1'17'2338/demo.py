@@ -0,0 +1,50 @@
+def ejecutar_demo(analizador):
+    """Prueba el analizador recibido con un ejemplo y, opcionalmente, con código del usuario"""
+    # Código de ejemplo para probar
+    codigo_ejemplo = """
+    int x = 5;
+    float precio = 19.99;
+    string nombre = "Juan";
+    bool activo = true;
+    int y;
+    
+    if (x > 0) {
+        y = x + 1;
+    }
+    
+    int z = x + y;
+    float descuento = precio * 0.1;
+    """
+    
+    print("ANALIZADOR SEMÁNTICO EN PYTHON")
+    print("=" * 40)
+    print("Código a analizar:")
+    print(codigo_ejemplo)
+    print("\n" + "=" * 40)
+    
+    # Ejecutar el analizador
+    resultado = analizador.analizar(codigo_ejemplo)
+    
+    print(resultado)
+    
+    # Ejemplo interactivo
+    print("\n" + "=" * 40)
+    print("¿Deseas probar con tu propio código? (s/n)")
+    respuesta = input().lower()
+    
+    if respuesta == 's':
+        print("Ingresa tu código (presiona Enter dos veces para finalizar):")
+        lineas = []
+        while True:
+            linea = input()
+            if linea == "" and len(lineas) > 0 and lineas[-1] == "":
+                break
+            lineas.append(linea)
+        
+        codigo_usuario = "\n".join(lineas)
+        resultado_usuario = analizador.analizar(codigo_usuario)
+        print("\n" + resultado_usuario)
+
+if __name__ == "__main__":
+    from main import AnalizadorSemantico
+    ejecutar_demo(AnalizadorSemantico())
\ No newline at end of file
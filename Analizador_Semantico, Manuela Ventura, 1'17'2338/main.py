@@ -1,4 +1,6 @@
 import re
+import sys
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
@@ -7,7 +9,8 @@ class TipoToken(Enum):
     """Tipos de tokens reconocidos"""
     TIPO_DATO = "TIPO_DATO"
     IDENTIFICADOR = "IDENTIFICADOR"
-    NUMERO = "NUMERO"
+    ENTERO = "ENTERO"
+    FLOTANTE = "FLOTANTE"
     CADENA = "CADENA"
     BOOLEANO = "BOOLEANO"
     OPERADOR = "OPERADOR"
@@ -17,15 +20,7 @@ class TipoToken(Enum):
     PUNTO_COMA = "PUNTO_COMA"
     DESCONOCIDO = "DESCONOCIDO"
 
-@dataclass
-class Token:
-    """Representa un token del código fuente"""
-    tipo: TipoToken
-    valor: str
-    linea: int
-    columna: int
-
-@dataclass
+@dataclass(slots=True)
 class Variable:
     """Representa una variable en la tabla de símbolos"""
     nombre: str
@@ -34,75 +29,145 @@ class Variable:
     inicializada: bool = False
     usada: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Error:
     """Representa un error semántico"""
     tipo: str
-    mensaje: str
+    plantilla: str
     linea: int
     columna: int = 0
+    argumentos: tuple = ()
+    
+    @property
+    def mensaje(self) -> str:
+        """Texto del error; si hay argumentos se formatea solo cuando se solicita"""
+        if self.argumentos:
+            return self.plantilla % self.argumentos
+        return self.plantilla
+
+# Patrones de tokens, compilados una sola vez al importar el módulo
+PATRONES_TOKENS = [
+    (TipoToken.TIPO_DATO, r'\b(int|float|double|bool|char|string|void)\b'),
+    (TipoToken.PALABRA_CLAVE, r'\b(if|else|while|for|return|break|continue|switch|case|default)\b'),
+    (TipoToken.BOOLEANO, r'\b(true|false)\b'),
+    (TipoToken.FLOTANTE, r'\b\d+\.\d*\b'),
+    (TipoToken.ENTERO, r'\b\d+\b'),
+    (TipoToken.CADENA, r'"[^"\n]*"'),
+    (TipoToken.IDENTIFICADOR, r'\b[a-zA-Z_][a-zA-Z0-9_]*\b'),
+    (TipoToken.ASIGNACION, r'='),
+    (TipoToken.OPERADOR, r'[+\-*/%<>=!&|]+'),
+    (TipoToken.PARENTESIS, r'[(){}[\]]'),
+    (TipoToken.PUNTO_COMA, r';'),
+]
+
+# Los comentarios de línea se reconocen antes que cualquier otro patrón y se descartan
+_GRUPO_COMENTARIO = 'COMENTARIO'
+_PATRON_COMENTARIO = r'//[^\n]*'
+
+_REGEX_TOKENS = re.compile(
+    f'(?P<{_GRUPO_COMENTARIO}>{_PATRON_COMENTARIO})|'
+    + '|'.join(f'(?P<{tipo.name}>{patron})' for tipo, patron in PATRONES_TOKENS)
+)
+
+# Búsqueda directa del tipo de token a partir del nombre del grupo capturado
+_TIPO_POR_GRUPO: Dict[str, TipoToken] = {tipo.name: tipo for tipo, _ in PATRONES_TOKENS}
+
+# Tokens cuyos valores se comparan repetidamente y conviene internar
+_GRUPOS_INTERNADOS = frozenset({
+    TipoToken.TIPO_DATO.name,
+    TipoToken.PALABRA_CLAVE.name,
+    TipoToken.BOOLEANO.name,
+    TipoToken.IDENTIFICADOR.name,
+})
 
 class AnalizadorLexico:
     """Analizador léxico para tokenizar el código fuente"""
     
-    def __init__(self):
-        self.patrones = [
-            (TipoToken.TIPO_DATO, r'\b(int|float|double|bool|char|string|void)\b'),
-            (TipoToken.PALABRA_CLAVE, r'\b(if|else|while|for|return|break|continue|switch|case|default)\b'),
-            (TipoToken.BOOLEANO, r'\b(true|false)\b'),
-            (TipoToken.NUMERO, r'\b\d+\.?\d*\b'),
-            (TipoToken.CADENA, r'"[^"]*"'),
-            (TipoToken.IDENTIFICADOR, r'\b[a-zA-Z_][a-zA-Z0-9_]*\b'),
-            (TipoToken.ASIGNACION, r'='),
-            (TipoToken.OPERADOR, r'[+\-*/%<>=!&|]+'),
-            (TipoToken.PARENTESIS, r'[(){}[\]]'),
-            (TipoToken.PUNTO_COMA, r';'),
-        ]
-        
-        self.patron_compilado = '|'.join(f'(?P<{tipo.name}>{patron})' for tipo, patron in self.patrones)
-        self.regex = re.compile(self.patron_compilado)
-    
-    def tokenizar(self, codigo: str) -> List[Token]:
-        """Convierte el código fuente en una lista de tokens"""
-        tokens = []
-        lineas = codigo.split('\n')
-        
-        for num_linea, linea in enumerate(lineas, 1):
-            linea = linea.strip()
-            if not linea or linea.startswith('//'):
+    @staticmethod
+    def tokenizar(codigo: str) -> Tuple[List[TipoToken], List[str], List[int], List[int]]:
+        """Convierte el código fuente en listas paralelas de tipos, valores, líneas y columnas"""
+        tipos: List[TipoToken] = []
+        valores: List[str] = []
+        lineas: List[int] = []
+        columnas: List[int] = []
+        
+        # Los tokens aparecen en orden, así que la línea actual se sigue avanzando
+        # hasta cada salto de línea en vez de buscarla para cada token
+        num_linea = 1
+        inicio_linea = 0
+        siguiente_salto = codigo.find('\n')
+        
+        for match in _REGEX_TOKENS.finditer(codigo):
+            grupo = match.lastgroup
+            if grupo == _GRUPO_COMENTARIO:
                 continue
-                
-            for match in self.regex.finditer(linea):
-                tipo_token = TipoToken[match.lastgroup]
-                valor = match.group()
-                columna = match.start()
-                
-                tokens.append(Token(tipo_token, valor, num_linea, columna))
-        
-        return tokens
+            
+            inicio = match.start()
+            while 0 <= siguiente_salto < inicio:
+                num_linea += 1
+                inicio_linea = siguiente_salto + 1
+                siguiente_salto = codigo.find('\n', inicio_linea)
+            columna = inicio - inicio_linea
+            
+            valor = match.group()
+            if grupo in _GRUPOS_INTERNADOS:
+                valor = sys.intern(valor)
+            
+            tipos.append(_TIPO_POR_GRUPO[grupo])
+            valores.append(valor)
+            lineas.append(num_linea)
+            columnas.append(columna)
+        
+        return tipos, valores, lineas, columnas
+
+@lru_cache(maxsize=8)
+def tokenizar_cacheado(codigo: str) -> Tuple[Tuple[TipoToken, ...], Tuple[str, ...], Tuple[int, ...], Tuple[int, ...]]:
+    """Tokeniza el código reutilizando el resultado si el mismo texto se analizó recientemente"""
+    # Se devuelven tuplas para que el resultado compartido no pueda modificarse
+    tipos, valores, lineas, columnas = AnalizadorLexico.tokenizar(codigo)
+    return tuple(tipos), tuple(valores), tuple(lineas), tuple(columnas)
+
+# Palabras clave que introducen una condición entre paréntesis
+_PALABRAS_CONTROL = frozenset({'if', 'while', 'for'})
+
+# Tipos que aceptan literales numéricos decimales y enteros respectivamente
+_TIPOS_DECIMALES = frozenset({'float', 'double'})
+_TIPOS_NUMERICOS = frozenset({'int', 'float', 'double'})
 
 class AnalizadorSemantico:
     """Analizador semántico principal"""
     
+    # Tipos de datos válidos
+    tipos_validos = frozenset({'int', 'float', 'double', 'bool', 'char', 'string', 'void'})
+    
+    # Operadores de compatibilidad
+    compatibilidad_tipos: Dict[str, frozenset] = {
+        'int': frozenset({'int', 'float', 'double'}),
+        'float': frozenset({'float', 'double'}),
+        'double': frozenset({'double'}),
+        'bool': frozenset({'bool'}),
+        'char': frozenset({'char'}),
+        'string': frozenset({'string'})
+    }
+    
+    # Tipos de variable que aceptan cada clase de literal
+    tipos_aceptados_por_literal: Dict[TipoToken, frozenset] = {
+        TipoToken.ENTERO: _TIPOS_NUMERICOS,
+        TipoToken.FLOTANTE: _TIPOS_DECIMALES,
+        TipoToken.BOOLEANO: frozenset({'bool'}),
+        TipoToken.CADENA: frozenset({'string'}),
+    }
+    
     def __init__(self):
         self.tabla_simbolos: Dict[str, Variable] = {}
         self.errores: List[Error] = []
         self.advertencias: List[Error] = []
-        self.tokens: List[Token] = []
+        # Tokens almacenados como secuencias paralelas (una entrada por token)
+        self.tipos: Tuple[TipoToken, ...] = ()
+        self.valores: Tuple[str, ...] = ()
+        self.lineas: Tuple[int, ...] = ()
+        self.columnas: Tuple[int, ...] = ()
         self.posicion = 0
-        
-        # Tipos de datos válidos
-        self.tipos_validos = {'int', 'float', 'double', 'bool', 'char', 'string', 'void'}
-        
-        # Operadores de compatibilidad
-        self.compatibilidad_tipos = {
-            'int': ['int', 'float', 'double'],
-            'float': ['float', 'double'],
-            'double': ['double'],
-            'bool': ['bool'],
-            'char': ['char'],
-            'string': ['string']
-        }
     
     def analizar(self, codigo: str) -> str:
         """Método principal para analizar el código"""
@@ -110,10 +175,9 @@ class AnalizadorSemantico:
         self.limpiar_estado()
         
         # Tokenizar el código
-        analizador_lexico = AnalizadorLexico()
-        self.tokens = analizador_lexico.tokenizar(codigo)
+        self.tipos, self.valores, self.lineas, self.columnas = tokenizar_cacheado(codigo)
         
-        if not self.tokens:
+        if not self.tipos:
             self.errores.append(Error("ERROR", "No se encontraron tokens válidos", 1))
             return self.generar_reporte()
         
@@ -121,274 +185,222 @@ class AnalizadorSemantico:
         self.analizar_tokens()
         
         # Verificaciones adicionales
-        self.verificar_variables_no_usadas()
-        self.verificar_variables_no_inicializadas()
+        self.verificar_variables()
         
         return self.generar_reporte()
     
     def limpiar_estado(self):
         """Limpia el estado del analizador"""
-        self.tabla_simbolos.clear()
-        self.errores.clear()
-        self.advertencias.clear()
-        self.tokens.clear()
+        # Se crean contenedores nuevos en lugar de vaciar los anteriores, de modo
+        # que quien conserve los resultados de un análisis previo no los vea cambiar
+        self.tabla_simbolos = {}
+        self.errores = []
+        self.advertencias = []
+        self.tipos = ()
+        self.valores = ()
+        self.lineas = ()
+        self.columnas = ()
         self.posicion = 0
     
     def analizar_tokens(self):
         """Analiza la secuencia de tokens"""
-        while self.posicion < len(self.tokens):
-            token_actual = self.tokens[self.posicion]
-            
-            if token_actual.tipo == TipoToken.TIPO_DATO:
-                self.analizar_declaracion()
-            elif token_actual.tipo == TipoToken.IDENTIFICADOR:
-                self.analizar_identificador()
-            elif token_actual.tipo == TipoToken.PALABRA_CLAVE:
-                self.analizar_palabra_clave()
+        tipos = self.tipos
+        n = len(tipos)
+        
+        # Tabla de despacho según el tipo del token actual
+        despacho = {
+            TipoToken.TIPO_DATO: self.analizar_declaracion,
+            TipoToken.IDENTIFICADOR: self.analizar_identificador,
+            TipoToken.PALABRA_CLAVE: self.analizar_palabra_clave,
+        }.get
+        
+        while self.posicion < n:
+            manejador = despacho(tipos[self.posicion])
+            if manejador:
+                manejador()
             else:
                 self.posicion += 1
     
     def analizar_declaracion(self):
         """Analiza una declaración de variable"""
-        if self.posicion >= len(self.tokens):
+        if self.posicion >= len(self.tipos):
             return
         
-        token_tipo = self.tokens[self.posicion]
+        pos_tipo = self.posicion
+        tipo_dato = self.valores[pos_tipo]
+        linea_tipo = self.lineas[pos_tipo]
         self.posicion += 1
         
-        if self.posicion >= len(self.tokens):
-            self.errores.append(Error("ERROR", f"Declaración incompleta en línea {token_tipo.linea}", token_tipo.linea))
+        if self.posicion >= len(self.tipos):
+            self.errores.append(Error("ERROR", "Declaración incompleta en línea %s", linea_tipo, argumentos=(linea_tipo,)))
             return
         
-        token_nombre = self.tokens[self.posicion]
-        
-        if token_nombre.tipo != TipoToken.IDENTIFICADOR:
-            self.errores.append(Error("ERROR", f"Se esperaba un identificador después de '{token_tipo.valor}' en línea {token_tipo.linea}", token_tipo.linea))
+        if self.tipos[self.posicion] != TipoToken.IDENTIFICADOR:
+            self.errores.append(Error("ERROR", "Se esperaba un identificador después de '%s' en línea %s", linea_tipo, argumentos=(tipo_dato, linea_tipo)))
             return
         
+        nombre = self.valores[self.posicion]
+        linea_nombre = self.lineas[self.posicion]
+        
         # Verificar si la variable ya existe
-        if token_nombre.valor in self.tabla_simbolos:
-            self.errores.append(Error("ERROR", f"Variable '{token_nombre.valor}' ya declarada en línea {token_nombre.linea}", token_nombre.linea))
+        tabla = self.tabla_simbolos
+        if nombre in tabla:
+            self.errores.append(Error("ERROR", "Variable '%s' ya declarada en línea %s", linea_nombre, argumentos=(nombre, linea_nombre)))
             return
         
         # Agregar variable a la tabla de símbolos
-        variable = Variable(token_nombre.valor, token_tipo.valor, token_nombre.linea)
-        self.tabla_simbolos[token_nombre.valor] = variable
+        variable = Variable(nombre, tipo_dato, linea_nombre)
+        tabla[nombre] = variable
         
         self.posicion += 1
         
         # Verificar si hay inicialización
-        if self.posicion < len(self.tokens) and self.tokens[self.posicion].tipo == TipoToken.ASIGNACION:
+        if self.posicion < len(self.tipos) and self.tipos[self.posicion] == TipoToken.ASIGNACION:
             self.analizar_inicializacion(variable)
     
     def analizar_inicializacion(self, variable: Variable):
         """Analiza la inicialización de una variable"""
         self.posicion += 1  # Saltar el '='
         
-        if self.posicion >= len(self.tokens):
-            self.errores.append(Error("ERROR", f"Inicialización incompleta para variable '{variable.nombre}' en línea {variable.linea_declaracion}", variable.linea_declaracion))
+        if self.posicion >= len(self.tipos):
+            self.errores.append(Error("ERROR", "Inicialización incompleta para variable '%s' en línea %s", variable.linea_declaracion, argumentos=(variable.nombre, variable.linea_declaracion)))
             return
         
-        token_valor = self.tokens[self.posicion]
-        
         # Verificar compatibilidad de tipos
-        if self.verificar_compatibilidad_tipos(variable.tipo, token_valor):
+        if self.verificar_compatibilidad_tipos(variable.tipo, self.posicion):
             variable.inicializada = True
         else:
-            self.errores.append(Error("ERROR", f"Tipo incompatible en inicialización de '{variable.nombre}' en línea {variable.linea_declaracion}", variable.linea_declaracion))
+            self.errores.append(Error("ERROR", "Tipo incompatible en inicialización de '%s' en línea %s", variable.linea_declaracion, argumentos=(variable.nombre, variable.linea_declaracion)))
         
         self.posicion += 1
     
     def analizar_identificador(self):
         """Analiza un identificador (uso de variable)"""
-        token_identificador = self.tokens[self.posicion]
+        nombre = self.valores[self.posicion]
+        variable = self.tabla_simbolos.get(nombre)
         
         # Verificar si la variable está declarada
-        if token_identificador.valor not in self.tabla_simbolos:
-            self.errores.append(Error("ERROR", f"Variable '{token_identificador.valor}' no declarada en línea {token_identificador.linea}", token_identificador.linea))
+        if variable is None:
+            linea = self.lineas[self.posicion]
+            self.errores.append(Error("ERROR", "Variable '%s' no declarada en línea %s", linea, argumentos=(nombre, linea)))
         else:
             # Marcar como usada
-            self.tabla_simbolos[token_identificador.valor].usada = True
+            variable.usada = True
             
             # Verificar si se está asignando valor
-            if self.posicion + 1 < len(self.tokens) and self.tokens[self.posicion + 1].tipo == TipoToken.ASIGNACION:
+            if self.posicion + 1 < len(self.tipos) and self.tipos[self.posicion + 1] == TipoToken.ASIGNACION:
                 self.posicion += 1  # Ir al '='
-                self.analizar_asignacion(token_identificador.valor)
+                self.analizar_asignacion(variable)
                 return
         
         self.posicion += 1
     
-    def analizar_asignacion(self, nombre_variable: str):
+    def analizar_asignacion(self, variable: Variable):
         """Analiza una asignación a una variable existente"""
         self.posicion += 1  # Saltar el '='
         
-        if self.posicion >= len(self.tokens):
-            self.errores.append(Error("ERROR", f"Asignación incompleta a variable '{nombre_variable}'", self.tokens[self.posicion-1].linea))
+        if self.posicion >= len(self.tipos):
+            self.errores.append(Error("ERROR", "Asignación incompleta a variable '%s'", self.lineas[self.posicion-1], argumentos=(variable.nombre,)))
             return
         
-        token_valor = self.tokens[self.posicion]
-        variable = self.tabla_simbolos[nombre_variable]
-        
         # Verificar compatibilidad de tipos
-        if self.verificar_compatibilidad_tipos(variable.tipo, token_valor):
+        if self.verificar_compatibilidad_tipos(variable.tipo, self.posicion):
             variable.inicializada = True
         else:
-            self.errores.append(Error("ERROR", f"Tipo incompatible en asignación a '{nombre_variable}' en línea {token_valor.linea}", token_valor.linea))
+            linea = self.lineas[self.posicion]
+            self.errores.append(Error("ERROR", "Tipo incompatible en asignación a '%s' en línea %s", linea, argumentos=(variable.nombre, linea)))
         
         self.posicion += 1
     
     def analizar_palabra_clave(self):
         """Analiza palabras clave como if, while, etc."""
-        token_palabra = self.tokens[self.posicion]
-        
-        if token_palabra.valor in ['if', 'while', 'for']:
+        if self.valores[self.posicion] in _PALABRAS_CONTROL:
             # Buscar condición entre paréntesis
-            self.analizar_estructura_control(token_palabra)
+            self.analizar_estructura_control(self.posicion)
         
         self.posicion += 1
     
-    def analizar_estructura_control(self, token_palabra: Token):
+    def analizar_estructura_control(self, pos_palabra: int):
         """Analiza estructuras de control"""
-        # Buscar paréntesis de apertura
-        parentesis_encontrado = False
-        pos_temp = self.posicion + 1
-        
-        while pos_temp < len(self.tokens):
-            if self.tokens[pos_temp].tipo == TipoToken.PARENTESIS and self.tokens[pos_temp].valor == '(':
-                parentesis_encontrado = True
-                break
-            pos_temp += 1
-        
-        if not parentesis_encontrado:
-            self.errores.append(Error("ERROR", f"Se esperaba '(' después de '{token_palabra.valor}' en línea {token_palabra.linea}", token_palabra.linea))
+        # Buscar paréntesis de apertura. Solo el patrón PARENTESIS produce el valor
+        # '(' (las cadenas conservan sus comillas), así que basta con buscar el valor
+        try:
+            self.valores.index('(', pos_palabra + 1)
+        except ValueError:
+            linea = self.lineas[pos_palabra]
+            self.errores.append(Error("ERROR", "Se esperaba '(' después de '%s' en línea %s", linea, argumentos=(self.valores[pos_palabra], linea)))
     
-    def verificar_compatibilidad_tipos(self, tipo_variable: str, token_valor: Token) -> bool:
-        """Verifica si un valor es compatible con un tipo de variable"""
-        if token_valor.tipo == TipoToken.NUMERO:
-            if '.' in token_valor.valor:
-                return tipo_variable in ['float', 'double']
-            else:
-                return tipo_variable in ['int', 'float', 'double']
-        
-        elif token_valor.tipo == TipoToken.BOOLEANO:
-            return tipo_variable == 'bool'
-        
-        elif token_valor.tipo == TipoToken.CADENA:
-            return tipo_variable == 'string'
-        
-        elif token_valor.tipo == TipoToken.IDENTIFICADOR:
-            # Verificar si es una variable del mismo tipo
-            if token_valor.valor in self.tabla_simbolos:
-                tipo_origen = self.tabla_simbolos[token_valor.valor].tipo
-                return tipo_origen in self.compatibilidad_tipos.get(tipo_variable, [])
-            return False
-        
-        return False
+    def verificar_compatibilidad_tipos(self, tipo_variable: str, pos_valor: int) -> bool:
+        """Verifica si el valor en la posición indicada es compatible con un tipo de variable"""
+        tipo_valor = self.tipos[pos_valor]
+        if tipo_valor == TipoToken.IDENTIFICADOR:
+            return self.compatible_con_identificador(tipo_variable, self.valores[pos_valor])
+        
+        aceptados = self.tipos_aceptados_por_literal.get(tipo_valor)
+        return aceptados is not None and tipo_variable in aceptados
     
-    def verificar_variables_no_usadas(self):
-        """Detecta variables declaradas pero no usadas"""
-        for variable in self.tabla_simbolos.values():
-            if not variable.usada:
-                self.advertencias.append(Error("ADVERTENCIA", f"Variable '{variable.nombre}' declarada pero no usada", variable.linea_declaracion))
+    def compatible_con_identificador(self, tipo_variable: str, valor: str) -> bool:
+        """Compatibilidad con otra variable, según su tipo declarado"""
+        origen = self.tabla_simbolos.get(valor)
+        return origen is not None and origen.tipo in self.compatibilidad_tipos.get(tipo_variable, frozenset())
     
-    def verificar_variables_no_inicializadas(self):
-        """Detecta variables usadas pero no inicializadas"""
+    def verificar_variables(self):
+        """Detecta variables no usadas y variables usadas sin inicializar"""
+        advertencias = self.advertencias
+        _Error = Error
         for variable in self.tabla_simbolos.values():
-            if variable.usada and not variable.inicializada:
-                self.advertencias.append(Error("ADVERTENCIA", f"Variable '{variable.nombre}' usada sin inicializar", variable.linea_declaracion))
+            if not variable.usada:
+                advertencias.append(_Error("ADVERTENCIA", "Variable '%s' declarada pero no usada", variable.linea_declaracion, argumentos=(variable.nombre,)))
+            elif not variable.inicializada:
+                advertencias.append(_Error("ADVERTENCIA", "Variable '%s' usada sin inicializar", variable.linea_declaracion, argumentos=(variable.nombre,)))
     
     def generar_reporte(self) -> str:
         """Genera el reporte final del análisis"""
         reporte = []
-        reporte.append("=" * 50)
-        reporte.append("REPORTE DE ANÁLISIS SEMÁNTICO")
-        reporte.append("=" * 50)
+        agregar = reporte.append
+        agregar("=" * 50)
+        agregar("REPORTE DE ANÁLISIS SEMÁNTICO")
+        agregar("=" * 50)
         
         # Tabla de símbolos
         if self.tabla_simbolos:
-            reporte.append("\n📋 TABLA DE SÍMBOLOS:")
-            reporte.append("-" * 30)
+            agregar("\n📋 TABLA DE SÍMBOLOS:")
+            agregar("-" * 30)
+            formato = "{:<15} | {:<8} | Línea {:<3} | {} | {}".format
             for nombre, variable in self.tabla_simbolos.items():
                 estado = "✓ Inicializada" if variable.inicializada else "⚠ No inicializada"
                 uso = "✓ Usada" if variable.usada else "⚠ No usada"
-                reporte.append(f"{nombre:<15} | {variable.tipo:<8} | Línea {variable.linea_declaracion:<3} | {estado} | {uso}")
+                agregar(formato(nombre, variable.tipo, variable.linea_declaracion, estado, uso))
         
         # Errores
         if self.errores:
-            reporte.append(f"\n❌ ERRORES ENCONTRADOS ({len(self.errores)}):")
-            reporte.append("-" * 30)
-            for error in self.errores:
-                reporte.append(f"Línea {error.linea}: {error.mensaje}")
+            agregar(f"\n❌ ERRORES ENCONTRADOS ({len(self.errores)}):")
+            agregar("-" * 30)
+            agregar("\n".join(f"Línea {error.linea}: {error.mensaje}" for error in self.errores))
         
         # Advertencias
         if self.advertencias:
-            reporte.append(f"\n⚠️ ADVERTENCIAS ({len(self.advertencias)}):")
-            reporte.append("-" * 30)
-            for advertencia in self.advertencias:
-                reporte.append(f"Línea {advertencia.linea}: {advertencia.mensaje}")
+            agregar(f"\n⚠️ ADVERTENCIAS ({len(self.advertencias)}):")
+            agregar("-" * 30)
+            agregar("\n".join(f"Línea {advertencia.linea}: {advertencia.mensaje}" for advertencia in self.advertencias))
         
         # Resumen
-        reporte.append(f"\n📊 RESUMEN:")
-        reporte.append("-" * 20)
-        reporte.append(f"Variables declaradas: {len(self.tabla_simbolos)}")
-        reporte.append(f"Errores: {len(self.errores)}")
-        reporte.append(f"Advertencias: {len(self.advertencias)}")
-        reporte.append(f"Tokens procesados: {len(self.tokens)}")
+        agregar(f"\n📊 RESUMEN:")
+        agregar("-" * 20)
+        agregar(f"Variables declaradas: {len(self.tabla_simbolos)}")
+        agregar(f"Errores: {len(self.errores)}")
+        agregar(f"Advertencias: {len(self.advertencias)}")
+        agregar(f"Tokens procesados: {len(self.tipos)}")
         
         if self.errores:
-            reporte.append("\n❌ ANÁLISIS COMPLETADO CON ERRORES")
+            agregar("\n❌ ANÁLISIS COMPLETADO CON ERRORES")
         else:
-            reporte.append("\n✅ ANÁLISIS COMPLETADO EXITOSAMENTE")
+            agregar("\n✅ ANÁLISIS COMPLETADO EXITOSAMENTE")
         
         return "\n".join(reporte)
 
-def main():
-    """Función principal para probar el analizador"""
-    # Código de ejemplo para probar
-    codigo_ejemplo = """
-    int x = 5;
-    float precio = 19.99;
-    string nombre = "Juan";
-    bool activo = true;
-    int y;
-    
-    if (x > 0) {
-        y = x + 1;
-    }
-    
-    int z = x + y;
-    float descuento = precio * 0.1;
-    """
-    
-    print("ANALIZADOR SEMÁNTICO EN PYTHON")
-    print("=" * 40)
-    print("Código a analizar:")
-    print(codigo_ejemplo)
-    print("\n" + "=" * 40)
-    
-    # Crear analizador y ejecutar
-    analizador = AnalizadorSemantico()
-    resultado = analizador.analizar(codigo_ejemplo)
-    
-    print(resultado)
-    
-    # Ejemplo interactivo
-    print("\n" + "=" * 40)
-    print("¿Deseas probar con tu propio código? (s/n)")
-    respuesta = input().lower()
-    
-    if respuesta == 's':
-        print("Ingresa tu código (presiona Enter dos veces para finalizar):")
-        lineas = []
-        while True:
-            linea = input()
-            if linea == "" and len(lineas) > 0 and lineas[-1] == "":
-                break
-            lineas.append(linea)
-        
-        codigo_usuario = "\n".join(lineas)
-        resultado_usuario = analizador.analizar(codigo_usuario)
-        print("\n" + resultado_usuario)
-
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    # La demostración interactiva vive en demo.py y solo se carga al ejecutar el script;
+    # recibe el analizador ya creado para no volver a importar este módulo
+    from demo import ejecutar_demo
+    ejecutar_demo(AnalizadorSemantico())
\ No newline at end of file